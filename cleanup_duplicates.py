@@ -18,13 +18,15 @@ Usage:
     ./cleanup_duplicates.py                      # dry-run, conservative
     ./cleanup_duplicates.py --apply              # delete safe (CalendarBridge) duplicates
     ./cleanup_duplicates.py --apply --include-all  # delete all extras per group
+    ./cleanup_duplicates.py --apply --workers 3  # fewer concurrent deletes
 """
 
 import os
-import sys
 import json
-import time
 import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Tuple, List, Optional
 
@@ -33,33 +35,46 @@ try:
 except ImportError:
     from backports.zoneinfo import ZoneInfo
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# Token locking/refresh, per-thread connections, the rate limiter and the
+# retry policy are shared with the sync so the two can't drift apart
+from safe_sync import (
+    TRANSIENT_NETWORK_ERRORS,
+    CircuitOpenError,
+    TokenBucket,
+    _thread_http,
+    get_credentials,
+    get_google_service,
+    log as _sync_log,
+    safe_api_call,
+)
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(ROOT, "calendar_config.json")
-TOKEN_PATH = os.path.join(ROOT, "token.json")
-CREDENTIALS_PATH = os.path.join(ROOT, "credentials.json")
 LOG_DIR = os.path.join(ROOT, "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_PATH = os.path.join(LOG_DIR, "cleanup_duplicates.log")
 REPORT_PATH = os.path.join(LOG_DIR, "cleanup_duplicates_report.json")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_PATH),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
+# safe_sync's "calendarbridge" logger already writes to stdout; this
+# child logger propagates there, and both also go to the cleanup log
+_file_handler = logging.FileHandler(LOG_PATH)
+_file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+_sync_log.addHandler(_file_handler)
 log = logging.getLogger("calendarbridge.cleanup")
 
 ORPHAN_MARKER = "CalendarBridge"
 
+DEFAULT_WORKERS = 5
+MAX_REQUESTS_PER_SECOND = 8.0  # shared by all workers, under Calendar's per-user QPS limit
+
+# Grouping, keep-selection and the report only read these
+LIST_FIELDS = (
+    "nextPageToken,"
+    "items(id,iCalUID,summary,start,end,created,updated,extendedProperties/private)"
+)
+
 
 # ------------- Config & Auth -------------
 
@@ -75,35 +90,6 @@ def load_config() -> Dict[str, Any]:
     return cfg
 
 
-def get_google_service(scopes=None):
-    if scopes is None:
-        scopes = ["https://www.googleapis.com/auth/calendar"]
-    creds = None
-    if os.path.exists(TOKEN_PATH):
-        try:
-            creds = Credentials.from_authorized_user_file(TOKEN_PATH, scopes)
-        except Exception as e:
-            log.warning(f"Failed to load token.json, re-auth required: {e}")
-            creds = None
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-            except Exception as e:
-                log.warning(f"Token refresh failed, re-authenticating: {e}")
-                creds = None
-
-        if not creds:
-            flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, scopes)
-            creds = flow.run_local_server(port=0)
-
-        with open(TOKEN_PATH, "w") as token:
-            token.write(creds.to_json())
-
-    return build("calendar", "v3", credentials=creds)
-
-
 def get_time_window_iso(cfg: Dict[str, Any]) -> Tuple[str, str]:
     now = datetime.now(timezone.utc)
     time_min = now - timedelta(days=int(cfg["sync_days_past"]))
@@ -113,6 +99,11 @@ def get_time_window_iso(cfg: Dict[str, Any]) -> Tuple[str, str]:
 
 # ------------- Helpers -------------
 
+# Retries, Retry-After, the deadline and the circuit breaker come from
+# safe_api_call; this limiter only sets the cleanup's own request rate
+_limiter = TokenBucket(MAX_REQUESTS_PER_SECOND, burst=MAX_REQUESTS_PER_SECOND)
+
+
 def _normalize_start(start: Dict[str, Any], tz: Optional[ZoneInfo] = None) -> Optional[str]:
     if not start:
         return None
@@ -125,13 +116,12 @@ def _normalize_start(start: Dict[str, Any], tz: Optional[ZoneInfo] = None) -> Op
         parsed = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
         if tz and parsed.tzinfo is not None:
             parsed = parsed.astimezone(tz)
-        return parsed.strftime("%Y-%m-%dT%H:%M:%S")
+        return parsed.replace(tzinfo=None).isoformat(timespec="seconds")
     except (ValueError, AttributeError):
         if "T" not in dt_str:
             return dt_str
-        date_part, time_part = dt_str.split("T", 1)
-        time_part = time_part.split("+")[0].split("-")[0]
-        time_part = time_part[:8]
+        date_part, _, rest = dt_str.partition("T")
+        time_part = rest[:8].partition("+")[0].partition("-")[0]
         return f"{date_part}T{time_part}"
 
 
@@ -147,13 +137,12 @@ def _normalize_end(end: Dict[str, Any], tz: Optional[ZoneInfo] = None) -> Option
         parsed = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
         if tz and parsed.tzinfo is not None:
             parsed = parsed.astimezone(tz)
-        return parsed.strftime("%Y-%m-%dT%H:%M:%S")
+        return parsed.replace(tzinfo=None).isoformat(timespec="seconds")
     except (ValueError, AttributeError):
         if "T" not in dt_str:
             return dt_str
-        date_part, time_part = dt_str.split("T", 1)
-        time_part = time_part.split("+")[0].split("-")[0]
-        time_part = time_part[:8]
+        date_part, _, rest = dt_str.partition("T")
+        time_part = rest[:8].partition("+")[0].partition("-")[0]
         return f"{date_part}T{time_part}"
 
 
@@ -177,21 +166,22 @@ def fetch_events(service, calendar_id: str, cfg: Dict[str, Any]) -> List[Dict[st
 
     while True:
         try:
-            resp = (
-                service.events()
-                .list(
+            resp = safe_api_call(
+                service.events().list(
                     calendarId=calendar_id,
                     timeMin=time_min,
                     timeMax=time_max,
                     singleEvents=True,
                     showDeleted=False,
-                    maxResults=2500,
+                    maxResults=1000,
                     orderBy="startTime",
                     pageToken=page_token,
-                )
-                .execute()
+                    fields=LIST_FIELDS,
+                ),
+                "list(events)",
+                _limiter,
             )
-        except HttpError as e:
+        except (HttpError, CircuitOpenError) as e:
             log.error(f"Failed to fetch events: {e}")
             break
 
@@ -207,23 +197,22 @@ def fetch_events(service, calendar_id: str, cfg: Dict[str, Any]) -> List[Dict[st
     return events
 
 
-def group_duplicates(events: List[Dict[str, Any]]) -> Dict[Tuple[str, str, str, str], List[Dict[str, Any]]]:
+def group_duplicates(
+    events: List[Dict[str, Any]], tz: Optional[ZoneInfo] = None
+) -> Dict[Tuple[str, str, str, str], List[Dict[str, Any]]]:
     """
     Group events by (uid, normalized_start, normalized_end, summary)
     Only groups with len > 1 are considered duplicates.
     """
     groups: Dict[Tuple[str, str, str, str], List[Dict[str, Any]]] = {}
 
-    # Load config timezone for consistent normalization
-    try:
-        cfg = load_config()
-        tz = ZoneInfo(cfg.get("timezone", "America/New_York"))
-    except Exception:
-        tz = None
+    uids = [get_uid(ev) for ev in events]
+    uid_counts = Counter(uids)
 
-    for ev in events:
-        uid = get_uid(ev)
-        if not uid:
+    for ev, uid in zip(events, uids):
+        # A duplicate needs a twin with the same UID; skip the time
+        # normalization for the (usual) singleton events
+        if not uid or uid_counts[uid] < 2:
             continue
 
         start_key = _normalize_start(ev.get("start") or {}, tz)
@@ -263,13 +252,41 @@ def pick_keep_and_delete(events: List[Dict[str, Any]]) -> Tuple[Dict[str, Any],
 
 # ------------- Main cleanup -------------
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Remove duplicate Google Calendar events.")
+    parser.add_argument("--apply", action="store_true",
+                        help="delete duplicates (default is a dry run)")
+    parser.add_argument("--include-all", action="store_true",
+                        help="delete all extra copies, not only CalendarBridge ones")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"concurrent delete requests (default {DEFAULT_WORKERS})")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def delete_duplicate(service, creds, cal_id: str, ev: Dict[str, Any]) -> bool:
+    gid = ev["id"]
+    try:
+        log.info(f"Deleting duplicate event {gid} (summary='{ev.get('summary', '')}', uid={get_uid(ev)})")
+        safe_api_call(service.events().delete(calendarId=cal_id, eventId=gid),
+                      f"Delete {gid}", _limiter, http=_thread_http(creds))
+        return True
+    except (HttpError, CircuitOpenError, *TRANSIENT_NETWORK_ERRORS) as e:
+        log.error(f"Failed to delete {gid}: {e}")
+        return False
+
+
 def main():
-    apply = "--apply" in sys.argv
-    include_all = "--include-all" in sys.argv
+    args = parse_args()
+    apply = args.apply
+    include_all = args.include_all
 
     cfg = load_config()
     cal_id = cfg["google_calendar_id"]
-    service = get_google_service()
+    creds = get_credentials()
+    service = get_google_service(creds)
 
     log.info("=" * 60)
     log.info(f"Duplicate cleanup starting for calendar {cal_id}")
@@ -277,7 +294,12 @@ def main():
     log.info(f"Include-all mode: {'YES (delete all extras per group)' if include_all else 'NO (CalendarBridge events only)'}")
 
     events = fetch_events(service, cal_id, cfg)
-    dup_groups = group_duplicates(events)
+    # Config timezone for consistent normalization
+    try:
+        tz = ZoneInfo(cfg.get("timezone", "America/New_York"))
+    except Exception:
+        tz = None
+    dup_groups = group_duplicates(events, tz)
 
     report = {
         "apply": apply,
@@ -288,17 +310,17 @@ def main():
 
     total_safe = 0
     total_deleted = 0
+    to_delete: List[Dict[str, Any]] = []
 
     for key, group in dup_groups.items():
         uid, start_key, end_key, summary = key
         keep, candidates = pick_keep_and_delete(group)
 
-        if include_all:
-            safe_deletes = list(candidates)  # delete all extras
-            unsafe = []
-        else:
-            safe_deletes = [ev for ev in candidates if is_our_event(ev)]
-            unsafe = [ev for ev in candidates if not is_our_event(ev)]
+        # One pass over the extras; include-all deletes every one of them
+        safe_deletes: List[Dict[str, Any]] = []
+        unsafe: List[Dict[str, Any]] = []
+        for ev in candidates:
+            (safe_deletes if include_all or is_our_event(ev) else unsafe).append(ev)
 
         group_entry = {
             "uid": uid,
@@ -313,21 +335,19 @@ def main():
         report["groups"].append(group_entry)
         total_safe += len(safe_deletes)
 
-        if apply and safe_deletes:
-            for ev in safe_deletes:
-                gid = ev.get("id")
-                if not gid:
-                    continue
-                try:
-                    log.info(f"Deleting duplicate event {gid} (summary='{summary}', uid={uid})")
-                    service.events().delete(calendarId=cal_id, eventId=gid).execute()
-                    total_deleted += 1
-                    time.sleep(0.25)  # Stay under Google's 500 req/100s quota
-                except HttpError as e:
-                    log.error(f"Failed to delete {gid}: {e}")
+        if apply:
+            to_delete.extend(ev for ev in safe_deletes if ev.get("id"))
+
+    if to_delete:
+        # Deletes are I/O-bound; the shared token bucket keeps the threads
+        # under the per-user QPS limit and backs off on rate-limit responses
+        log.info(f"Deleting {len(to_delete)} duplicates with {args.workers} workers")
+        with ThreadPoolExecutor(max_workers=args.workers) as ex:
+            results = ex.map(lambda ev: delete_duplicate(service, creds, cal_id, ev), to_delete)
+            total_deleted = sum(1 for ok in results if ok)
 
     with open(REPORT_PATH, "w") as f:
-        json.dump(report, f, indent=2)
+        f.write(json.dumps(report, indent=2))
 
     log.info("=" * 60)
     log.info(f"Duplicate cleanup complete. Safe duplicates identified: {total_safe}")
@@ -1,6 +1,6 @@
 #!/usr/bin/env bash
 # ============================================================================
-# CalendarBridge Full Sync v7.0.0
+# CalendarBridge Full Sync v7.1.0
 #
 # Single entry point for both LaunchAgent and manual runs.
 # Merges the old run_sync_wrapper.sh logic — no separate wrapper needed.
@@ -43,7 +43,7 @@ if [ -f "${LOCK_FILE}" ]; then
 fi
 echo $$ > "${LOCK_FILE}"
 
-log "========== CalendarBridge v7.0.1 :: ${LOG_TS} =========="
+log "========== CalendarBridge v7.1.0 :: ${LOG_TS} =========="
 
 # ============================================================================
 # Pre-flight checks
@@ -89,17 +89,17 @@ fi
 # ============================================================================
 if [ "${SKIP_EXPORT}" -eq 0 ]; then
     log "[2/3] Exporting from Outlook..."
-    CAL_NAME=$("${PY}" -c "
+    # One interpreter start for both settings; the name may contain spaces,
+    # so it goes last and read assigns it the rest of the line
+    CAL_INDEX="" CAL_NAME=""
+    read -r CAL_INDEX CAL_NAME < <("${PY}" -c "
 import json
-c = json.load(open('${ROOT}/calendar_config.json'))
-print(c.get('outlook_calendar_name', 'Calendar'))
-" 2>/dev/null || echo "Calendar")
-
-    CAL_INDEX=$("${PY}" -c "
-import json
-c = json.load(open('${ROOT}/calendar_config.json'))
-print(c.get('outlook_calendar_index', 2))
-" 2>/dev/null || echo "2")
+with open('${ROOT}/calendar_config.json') as f:
+    c = json.load(f)
+print(c.get('outlook_calendar_index', 2), c.get('outlook_calendar_name', 'Calendar'))
+" 2>/dev/null) || true
+    CAL_INDEX="${CAL_INDEX:-2}"
+    CAL_NAME="${CAL_NAME:-Calendar}"
 
     if osascript "${ROOT}/exportEvents.scpt" "${CAL_NAME}" "${CAL_INDEX}" >> "${LOG_FILE}" 2>&1; then
         log "Export OK"
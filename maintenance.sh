@@ -64,9 +64,12 @@ health_check() {
     local last_log
     last_log=$(ls -t "${LOG_DIR}"/full_sync_*.log 2>/dev/null | head -1)
     if [ -n "${last_log}" ]; then
-        if grep -q "SYNC OK" "${last_log}"; then
+        # Status markers are written last — only read the tail of the log
+        local last_tail
+        last_tail=$(tail -c 8192 "${last_log}" 2>/dev/null || true)
+        if grep -q "SYNC OK" <<< "${last_tail}"; then
             log "OK: Last sync succeeded"
-        elif grep -q "SYNC COMPLETE" "${last_log}"; then
+        elif grep -q "SYNC COMPLETE" <<< "${last_tail}"; then
             log "OK: Last sync completed"
         else
             log "WARN: Last sync may have failed — check ${last_log}"
@@ -93,7 +96,8 @@ health_check() {
         local event_count
         event_count=$(python3 -c "
 import json
-print(len(json.load(open('${ROOT}/sync_state.json')).get('events', {})))
+with open('${ROOT}/sync_state.json') as f:
+    print(len(json.load(f).get('events', {})))
 " 2>/dev/null || echo "unknown")
         log "OK: State file has ${event_count} events tracked"
     else
@@ -7,7 +7,7 @@ Version 7.0.0
 Changes from 6.1.0:
 - Atomic state file writes (crash-safe)
 - ICS staleness guard (configurable max age)
-- Exponential backoff on rate limits (429/5xx)
+- Full-jitter exponential backoff on rate limits (429/5xx)
 - Config validation on startup
 - macOS notification on failure
 - Streamlined logging (single log target)
@@ -16,15 +16,26 @@ Changes from 6.1.0:
 
 import os
 import sys
+import re
 import json
+import base64
 import time
+import random
+import fcntl
+import mmap
 import shutil
+import socket
+import pickle
 import logging
 import hashlib
 import tempfile
+import threading
 import subprocess
-from dataclasses import dataclass
-from typing import Dict, Any, Optional, Tuple, Union, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional, Tuple, Union, List, NamedTuple
 from datetime import datetime, date, timedelta, timezone
 
 try:
@@ -32,10 +43,26 @@ try:
 except ImportError:
     from backports.zoneinfo import ZoneInfo
 
+try:
+    # Optional: several times faster on the state file, which carries the
+    # Google listing cache. Its JSONDecodeError subclasses json's.
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 from icalendar import Calendar
 from recurring_ical_events import of as recurring_of
 
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
@@ -50,16 +77,60 @@ CONFIG_PATH = os.path.join(ROOT, "calendar_config.json")
 STATE_PATH = os.path.join(ROOT, "sync_state.json")
 TOKEN_PATH = os.path.join(ROOT, "token.json")
 CREDENTIALS_PATH = os.path.join(ROOT, "credentials.json")
+TOKEN_LOCK_PATH = os.path.join(ROOT, ".token.lock")
+ICS_CACHE_PATH = os.path.join(ROOT, ".ics_cache.pickle")
+ICS_PATH = os.path.join(ROOT, "outbox", "outlook_full_export.ics")
 LOG_DIR = os.path.join(ROOT, "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 
 ORPHAN_MARKER = "CalendarBridge"
-VERSION = "7.0.1"
+VERSION = "7.1.0"
 
 # Backoff settings
 MAX_RETRIES = 5
 INITIAL_BACKOFF_SECONDS = 2.0
-MAX_BACKOFF_SECONDS = 60.0
+MAX_BACKOFF_SECONDS = 32.0
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+# No single call (or batch requeue loop) keeps retrying past this
+RETRY_DEADLINE_SECONDS = 180.0
+# Calls that exhaust their retries this many times in a row open the
+# circuit; further calls fail fast until the cooldown has passed
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN_SECONDS = 60.0
+# Dropped or timed-out connections, retried with the same backoff
+TRANSIENT_NETWORK_ERRORS = (ConnectionError, TimeoutError, socket.timeout)
+
+# Google's documented maximum sub-requests per batch
+BATCH_SIZE = 50
+
+# Full Google listings reach this far past the window so syncToken
+# deltas stay valid for a week before the next full listing
+GOOGLE_CACHE_HORIZON_DAYS = 7
+
+# Partial response for events.list — only what key matching, window
+# filtering, orphan detection and delta merging read
+GOOGLE_LIST_FIELDS = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,status,iCalUID,summary,start,end,extendedProperties/private)"
+)
+
+# Hex length of the SHA-256 content hashes older state files hold
+LEGACY_HASH_LENGTH = 64
+# Part of the ICS cache signature — bump when compute_event_hash changes
+HASH_SCHEME = "blake2b-16"
+
+# insert/patch responses echo the whole event; only the id is read back
+WRITE_RESPONSE_FIELDS = "id"
+
+# Per-request socket timeout for every Google connection
+HTTP_TIMEOUT_SECONDS = 60
+
+# Refresh the access token this long before it expires
+TOKEN_REFRESH_MARGIN_SECONDS = 120
+
+# Parsed ICS results cover this much extra on each side of the window,
+# so an unchanged export can be reused while the window slides
+ICS_CACHE_MARGIN = timedelta(days=1)
 
 # ============================================================================
 # Logging — single handler, configured by caller (full_sync.sh) or standalone
@@ -97,6 +168,12 @@ def notify(title: str, message: str):
 
 @dataclass
 class LocalEvent:
+    # Slots instead of a per-instance __dict__: one of these is held for
+    # every expanded occurrence in the window (and in the ICS cache)
+    __slots__ = (
+        "uid", "key", "summary", "location", "description", "start", "end", "all_day",
+    )
+
     uid: str
     key: str
     summary: str
@@ -107,6 +184,13 @@ class LocalEvent:
     all_day: bool
 
 
+class GoogleEvent(NamedTuple):
+    """The parts of a Google event the sync reads after fetching."""
+    id: str
+    summary: str
+    ours: bool
+
+
 # ============================================================================
 # Configuration & Validation
 # ============================================================================
@@ -119,6 +203,7 @@ _CONFIG_SCHEMA = {
     "outlook_calendar_name": {"type": str, "required": False, "default": "Calendar"},
     "outlook_calendar_index": {"type": int, "required": False, "default": 2},
     "api_delay_seconds": {"type": float, "required": False, "default": 1.05},
+    "batch_workers": {"type": int, "required": False, "default": 2, "min": 1, "max": 8},
     "max_ics_age_hours": {"type": float, "required": False, "default": 2.0},
     "enable_notifications": {"type": bool, "required": False, "default": True},
 }
@@ -184,7 +269,46 @@ def get_timezone(tz_name: str) -> ZoneInfo:
 # Authentication
 # ============================================================================
 
-def get_google_service(scopes: Optional[List[str]] = None):
+@contextmanager
+def file_lock(path: str):
+    """Exclusive advisory lock — serializes launchd, cron and manual runs."""
+    with open(path, "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _token_needs_refresh(creds: Credentials) -> bool:
+    """True if the access token is invalid or expires within the margin."""
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth stores expiry as naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now < timedelta(seconds=TOKEN_REFRESH_MARGIN_SECONDS)
+
+
+def _save_token(creds: Credentials):
+    """Atomic write: temp file → rename, so readers never see a torn token."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(TOKEN_PATH) or ".", prefix=".token_", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(creds.to_json())
+        os.replace(tmp_path, TOKEN_PATH)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except Exception:
+            pass
+        raise
+
+
+def get_credentials(scopes: Optional[List[str]] = None) -> Credentials:
     if scopes is None:
         scopes = ["https://www.googleapis.com/auth/calendar"]
 
@@ -193,32 +317,58 @@ def get_google_service(scopes: Optional[List[str]] = None):
             f"Missing {CREDENTIALS_PATH} — copy your Google OAuth credentials file here."
         )
 
-    creds = None
-    if os.path.exists(TOKEN_PATH):
-        try:
-            creds = Credentials.from_authorized_user_file(TOKEN_PATH, scopes)
-        except Exception as e:
-            log.warning(f"Failed to load token.json, re-authenticating: {e}")
-            creds = None
+    # Held across load → refresh → save so concurrent runs reuse one
+    # refreshed token instead of each hitting the token endpoint.
+    with file_lock(TOKEN_LOCK_PATH):
+        creds = None
+        if os.path.exists(TOKEN_PATH):
+            try:
+                creds = Credentials.from_authorized_user_file(TOKEN_PATH, scopes)
+            except Exception as e:
+                log.warning(f"Failed to load token.json, re-authenticating: {e}")
+                creds = None
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+        if creds and _token_needs_refresh(creds) and creds.refresh_token:
             try:
                 creds.refresh(Request())
             except Exception as e:
                 log.warning(f"Token refresh failed, re-authenticating: {e}")
                 creds = None
-
-        if not creds:
+            else:
+                # A failed save must not throw away a good token and start
+                # an interactive re-auth (possibly under launchd)
+                try:
+                    _save_token(creds)
+                except Exception as e:
+                    log.error(f"Failed to save refreshed token: {e}")
+
+        if not creds or not creds.valid:
             flow = InstalledAppFlow.from_client_secrets_file(
                 CREDENTIALS_PATH, scopes
             )
             creds = flow.run_local_server(port=0)
+            _save_token(creds)
+
+    return creds
+
+
+def get_google_service(creds: Optional[Credentials] = None):
+    if creds is None:
+        creds = get_credentials()
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+    return build("calendar", "v3", http=http, cache_discovery=False)
 
-        with open(TOKEN_PATH, "w") as token:
-            token.write(creds.to_json())
 
-    return build("calendar", "v3", credentials=creds, cache_discovery=False)
+_thread_local = threading.local()
+
+
+def _thread_http(creds: Credentials) -> AuthorizedHttp:
+    """One keep-alive connection per worker thread — httplib2 is not thread-safe."""
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+        _thread_local.http = http
+    return http
 
 
 # ============================================================================
@@ -241,8 +391,8 @@ class SyncState:
             return
 
         try:
-            with open(self.path, "r") as f:
-                loaded = json.load(f)
+            with open(self.path, "rb") as f:
+                loaded = _json_loads(f.read())
             # Basic structure validation
             if isinstance(loaded, dict) and "events" in loaded:
                 self.data = loaded
@@ -267,8 +417,11 @@ class SyncState:
                 prefix=".sync_state_",
                 suffix=".tmp",
             )
-            with os.fdopen(fd, "w") as f:
-                json.dump(self.data, f, indent=2)
+            # Encode first, then one write — json.dump issues a write()
+            # per encoder chunk, which adds up now the Google cache lives here
+            payload = _json_dumps(self.data)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
             os.replace(tmp_path, self.path)  # atomic on POSIX
         except Exception as e:
             log.error(f"Failed to save state: {e}")
@@ -293,6 +446,24 @@ class SyncState:
         self.data.get("events", {}).pop(key, None)
         self.data.get("google_ids", {}).pop(key, None)
 
+    def get_google_cache(self, calendar_id: str) -> Optional[Dict[str, Any]]:
+        cache = self.data.get("google_cache")
+        if isinstance(cache, dict) and cache.get("calendar_id") == calendar_id:
+            return cache
+        return None
+
+    def set_google_cache(self, cache: Dict[str, Any]):
+        self.data["google_cache"] = cache
+
+    def clear_google_cache(self):
+        self.data.pop("google_cache", None)
+
+    def drop_google_item(self, google_id: str):
+        """Forget a cached Google event that no delta will ever report again."""
+        cache = self.data.get("google_cache")
+        if isinstance(cache, dict):
+            cache.get("items", {}).pop(google_id, None)
+
 
 # ============================================================================
 # Time Utilities
@@ -301,52 +472,59 @@ class SyncState:
 def get_sync_window(
     cfg: Dict[str, Any], tz: ZoneInfo
 ) -> Tuple[datetime, datetime]:
+    """Window bounds as aware datetimes in tz."""
     now = datetime.now(tz)
     start = now - timedelta(days=int(cfg["sync_days_past"]))
     end = now + timedelta(days=int(cfg["sync_days_future"]))
-    return start.replace(tzinfo=None), end.replace(tzinfo=None)
-
-
-def normalize_to_date(dt_or_date: Union[datetime, date], tz: ZoneInfo) -> date:
-    if isinstance(dt_or_date, date) and not isinstance(dt_or_date, datetime):
-        return dt_or_date
-    if isinstance(dt_or_date, datetime):
-        if dt_or_date.tzinfo is None:
-            dt_or_date = dt_or_date.replace(tzinfo=tz)
-        return dt_or_date.astimezone(tz).date()
-    raise TypeError(f"Unsupported type: {type(dt_or_date)}")
+    return start, end
 
 
 def normalize_to_datetime(
     dt: Union[datetime, date], tz: ZoneInfo
 ) -> datetime:
-    if isinstance(dt, datetime):
-        if dt.tzinfo is None:
+    kind = type(dt)
+    if kind is datetime:
+        tzinfo = dt.tzinfo
+        if tzinfo is tz:
+            # LocalEvent times are already in tz — the common case
+            return dt
+        if tzinfo is None:
             return dt.replace(tzinfo=tz)
         return dt.astimezone(tz)
-    if isinstance(dt, date):
+    if kind is date:
         return datetime(dt.year, dt.month, dt.day, tzinfo=tz)
     raise TypeError(f"Unsupported type: {type(dt)}")
 
 
 def is_all_day_event(comp) -> bool:
     """Detect all-day events using multiple heuristics."""
-    ms_allday = comp.get("X-MICROSOFT-CDO-ALLDAYEVENT")
+    dtstart_prop = comp.get("DTSTART")
+    dtend_prop = comp.get("DTEND")
+    return is_all_day(
+        comp.get("X-MICROSOFT-CDO-ALLDAYEVENT"),
+        dtstart_prop.dt if dtstart_prop else None,
+        dtend_prop.dt if dtend_prop is not None else None,
+    )
+
+
+def is_all_day(
+    ms_allday: Any,
+    dtstart: Optional[Union[datetime, date]],
+    dtend: Optional[Union[datetime, date]],
+) -> bool:
+    """All-day heuristics on already-decoded DTSTART/DTEND values."""
     if ms_allday and str(ms_allday).strip().upper() == "TRUE":
         return True
 
-    dtstart_prop = comp.get("DTSTART")
-    if not dtstart_prop:
+    if dtstart is None:
         return False
 
-    dtstart = dtstart_prop.dt
-    if isinstance(dtstart, date) and not isinstance(dtstart, datetime):
+    # Exact type checks: icalendar only yields plain date/datetime here
+    if type(dtstart) is date:
         return True
 
-    dtend_prop = comp.get("DTEND")
-    if isinstance(dtstart, datetime) and dtend_prop is not None:
-        dtend = dtend_prop.dt
-        if isinstance(dtend, datetime):
+    if dtend is not None and type(dtend) is datetime:
+        if type(dtstart) is datetime:
             start_midnight = (
                 dtstart.hour == 0
                 and dtstart.minute == 0
@@ -362,19 +540,98 @@ def is_all_day_event(comp) -> bool:
     return False
 
 
-def compute_event_hash(ev: LocalEvent, tz: ZoneInfo) -> str:
-    """Generate content hash for change detection."""
-    if ev.all_day:
-        start_repr = normalize_to_date(ev.start, tz).isoformat()
-        end_repr = normalize_to_date(ev.end, tz).isoformat()
-    else:
-        start_repr = normalize_to_datetime(ev.start, tz).isoformat(
-            timespec="seconds"
-        )
-        end_repr = normalize_to_datetime(ev.end, tz).isoformat(
-            timespec="seconds"
+def make_local_event(
+    uid: str,
+    summary: str,
+    location: str,
+    description: str,
+    dtstart: Union[datetime, date],
+    dtend: Optional[Union[datetime, date]],
+    all_day: bool,
+    tz: ZoneInfo,
+) -> LocalEvent:
+    """
+    Build a LocalEvent keyed by UID|normalized_start. Keys are interned so
+    matching against Google keys settles on identity, not string compares.
+    """
+    if all_day:
+        # For all-day events, extract date without timezone conversion
+        # to avoid midnight-UTC shifting to previous day in local tz
+        start_date = dtstart.date() if type(dtstart) is datetime else dtstart
+        if dtend:
+            end_date = dtend.date() if type(dtend) is datetime else dtend
+        else:
+            end_date = start_date + timedelta(days=1)
+        if end_date <= start_date:
+            end_date = start_date + timedelta(days=1)
+
+        key = sys.intern(f"{uid}|{start_date.isoformat()}")
+        return LocalEvent(
+            uid=uid,
+            key=key,
+            summary=summary,
+            location=location,
+            description=description,
+            start=start_date,
+            end=end_date,
+            all_day=True,
         )
 
+    start_dt = normalize_to_datetime(dtstart, tz)
+    end_dt = (
+        normalize_to_datetime(dtend, tz)
+        if dtend is not None
+        else start_dt + timedelta(hours=1)
+    )
+
+    # Wall-clock time in tz, no offset — same form as _normalize_start_for_key
+    start_key = start_dt.replace(tzinfo=None).isoformat(timespec="seconds")
+    key = sys.intern(f"{uid}|{start_key}")
+
+    return LocalEvent(
+        uid=uid,
+        key=key,
+        summary=summary,
+        location=location,
+        description=description,
+        start=start_dt,
+        end=end_dt,
+        all_day=False,
+    )
+
+
+def _event_time_reprs(ev: LocalEvent, tz: ZoneInfo) -> Tuple[str, str]:
+    # make_local_event already normalized: dates for all-day events,
+    # datetimes in tz otherwise — no per-field type dispatch needed
+    if ev.all_day:
+        return ev.start.isoformat(), ev.end.isoformat()
+    return (
+        ev.start.isoformat(timespec="seconds"),
+        ev.end.isoformat(timespec="seconds"),
+    )
+
+
+def compute_event_hash(ev: LocalEvent, tz: ZoneInfo) -> str:
+    """
+    Generate content hash for change detection (not security-sensitive).
+    Fields are NUL-joined and hashed directly — no JSON encoding per event.
+    """
+    start_repr, end_repr = _event_time_reprs(ev, tz)
+    data = "\0".join((
+        ev.uid,
+        ev.summary,
+        ev.location,
+        ev.description,
+        "1" if ev.all_day else "0",
+        start_repr,
+        end_repr,
+    ))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _legacy_event_hash(ev: LocalEvent, tz: ZoneInfo) -> str:
+    """SHA-256 hash written to state by versions up to 7.0.2."""
+    start_repr, end_repr = _event_time_reprs(ev, tz)
     payload = {
         "uid": ev.uid,
         "summary": ev.summary,
@@ -388,6 +645,23 @@ def compute_event_hash(ev: LocalEvent, tz: ZoneInfo) -> str:
     return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
 
+def hash_matches(
+    stored: Optional[str], content_hash: str, ev: LocalEvent, tz: ZoneInfo
+) -> bool:
+    """
+    True if the stored hash describes the same content. Hashes from before
+    the switch to BLAKE2b (64 hex chars) are checked against the old scheme,
+    so the upgrade doesn't re-patch every event.
+    """
+    if stored == content_hash:
+        return True
+    return (
+        stored is not None
+        and len(stored) == LEGACY_HASH_LENGTH
+        and stored == _legacy_event_hash(ev, tz)
+    )
+
+
 def to_iso(dt: datetime) -> str:
     """Convert datetime to ISO format in UTC."""
     if dt.tzinfo is None:
@@ -399,16 +673,18 @@ def to_iso(dt: datetime) -> str:
 # ICS Parsing — with Staleness Guard
 # ============================================================================
 
-def check_ics_freshness(ics_path: str, max_age_hours: float) -> bool:
+def check_ics_freshness(ics_path: str, max_age_hours: float) -> os.stat_result:
     """
     Verify ICS file exists and isn't stale.
-    Returns True if fresh enough, raises SystemExit if stale.
+    Returns the file's stat if fresh enough, raises SystemExit if stale.
     """
-    if not os.path.exists(ics_path):
+    # One stat covers both the existence check and the mtime
+    try:
+        st = os.stat(ics_path)
+    except FileNotFoundError:
         raise SystemExit(f"No ICS file at {ics_path}")
 
-    mtime = os.path.getmtime(ics_path)
-    age_seconds = time.time() - mtime
+    age_seconds = time.time() - st.st_mtime
     age_hours = age_seconds / 3600
 
     if age_hours > max_age_hours:
@@ -423,57 +699,606 @@ def check_ics_freshness(ics_path: str, max_age_hours: float) -> bool:
         )
 
     log.info(f"ICS file age: {age_hours:.1f}h (max: {max_age_hours}h) — fresh")
+    return st
+
+
+# ============================================================================
+# ICS Parsing — Fast Path
+# ============================================================================
+
+# Any of these on a VEVENT sends every component sharing its UID through
+# icalendar + recurring_ical_events for expansion.
+_RECURRENCE_PROPS = ("RRULE", "RDATE", "EXDATE", "RECURRENCE-ID")
+
+# The only VEVENT properties the sync reads.
+_FAST_PROPS = frozenset({
+    "UID", "SUMMARY", "LOCATION", "DESCRIPTION", "DTSTART", "DTEND",
+    "DURATION", "X-MICROSOFT-CDO-ALLDAYEVENT", *_RECURRENCE_PROPS,
+})
+
+# DATE (YYYYMMDD) or DATE-TIME (YYYYMMDDTHHMMSS[Z])
+_ICS_DATETIME_RE = re.compile(
+    r"(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})(Z)?)?$"
+)
+
+# {NAME: ({PARAM: value}, value)} for one VEVENT
+_Props = Dict[str, Tuple[Dict[str, str], str]]
+
+
+_FOLD_RE = re.compile(r"\n[ \t]")
+# Component boundaries; matched in place so ordinary lines aren't upper-cased
+_COMPONENT_RE = re.compile(r"(?:BEGIN|END):", re.IGNORECASE)
+
+
+def _unfold_lines(text: str) -> List[str]:
+    """Split ICS text into logical lines, joining RFC 5545 continuations."""
+    unfolded = _FOLD_RE.sub("", text.replace("\r\n", "\n"))
+    return [line for line in unfolded.split("\n") if line]
+
+
+def _split_property(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Split a content line into (NAME, {PARAM: value}, value)."""
+    colon = line.find(":")
+    if colon < 0:
+        return line.upper(), {}, ""
+    quote = line.find('"')
+    if 0 <= quote < colon:
+        # Quoted parameter values may contain ':' and ';'
+        in_quotes = False
+        for i, ch in enumerate(line):
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ":" and not in_quotes:
+                colon = i
+                break
+
+    head, value = line[:colon], line[colon + 1:]
+    name, _, param_str = head.partition(";")
+    params: Dict[str, str] = {}
+    if param_str:
+        for part in param_str.split(";"):
+            pname, _, pval = part.partition("=")
+            params[pname.upper()] = pval.strip('"')
+    return name.upper(), params, value
+
+
+def _unescape_text(value: str) -> str:
+    """Undo RFC 5545 TEXT escaping (mirrors icalendar's vText)."""
+    return (
+        value.replace("\\N", "\\n")
+        .replace("\\n", "\n")
+        .replace("\\,", ",")
+        .replace("\\;", ";")
+        .replace("\\\\", "\\")
+    )
+
+
+@lru_cache(maxsize=None)
+def _zone(tzid: str) -> Optional[ZoneInfo]:
+    """Resolve a TZID once per run; Windows names miss and would re-search tzdata every event."""
+    try:
+        return ZoneInfo(tzid)
+    except Exception:
+        return None
+
+
+def _decode_ics_datetime(
+    params: Dict[str, str], value: str
+) -> Optional[Union[datetime, date]]:
+    """
+    Decode a DTSTART/DTEND value without icalendar.
+    Returns None for anything the fast path can't resolve exactly
+    (non-IANA TZIDs, unusual formats) so the caller can fall back.
+    """
+    m = _ICS_DATETIME_RE.match(value.strip())
+    if not m:
+        return None
+    year, month, day, hour, minute, second, utc = m.groups()
+    try:
+        if hour is None:
+            return date(int(year), int(month), int(day))
+        if params.get("VALUE", "").upper() == "DATE":
+            return None
+        dt = datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second)
+        )
+    except ValueError:
+        return None
+    if utc:
+        return dt.replace(tzinfo=timezone.utc)
+
+    tzid = params.get("TZID")
+    if not tzid:
+        return dt  # floating time
+    zone = _zone(tzid)
+    return dt.replace(tzinfo=zone) if zone else None
+
+
+def _scan_vcalendar(
+    text: str,
+) -> Tuple[List[str], List[str], List[Tuple[_Props, List[str]]]]:
+    """
+    Single pass over one VCALENDAR block.
+    Returns (header lines, VTIMEZONE lines, [(props, raw VEVENT lines)]),
+    where props holds only the first occurrence of each property the sync
+    reads. Nested components (VALARM) don't leak into their VEVENT.
+    """
+    header: List[str] = []
+    timezones: List[str] = []
+    events: List[Tuple[_Props, List[str]]] = []
+
+    stack: List[str] = []
+    props: _Props = {}
+    raw: List[str] = []
+
+    for line in _unfold_lines(text):
+        boundary = _COMPONENT_RE.match(line) is not None
+        is_begin = boundary and line[0] in "Bb"
+        is_end = boundary and not is_begin
+        if is_begin:
+            stack.append(line[6:].strip().upper())
+            if stack[1:] == ["VEVENT"]:
+                props, raw = {}, []
+
+        depth = len(stack)
+        top = stack[1] if depth >= 2 else None
+        if top == "VEVENT":
+            raw.append(line)
+            if depth == 2 and not (is_begin or is_end):
+                name, params, value = _split_property(line)
+                if name in _FAST_PROPS and name not in props:
+                    props[name] = (params, value)
+        elif top == "VTIMEZONE":
+            timezones.append(line)
+        elif depth == 1 and not (is_begin or is_end):
+            header.append(line)
+
+        if is_end and stack:
+            if stack.pop() == "VEVENT" and len(stack) == 1:
+                events.append((props, raw))
+
+    return header, timezones, events
+
+
+def _timezone_defs(lines: List[str]) -> Dict[Optional[str], List[str]]:
+    """Split a block's VTIMEZONE lines into {TZID: definition lines}."""
+    defs: Dict[Optional[str], List[str]] = {}
+    current: List[str] = []
+    for line in lines:
+        upper = line[:15].upper()
+        if upper == "BEGIN:VTIMEZONE":
+            current = [line]
+            continue
+        current.append(line)
+        if upper.startswith("END:VTIMEZONE"):
+            tzid = next(
+                (l.split(":", 1)[-1].strip() for l in current
+                 if l[:4].upper() == "TZID"),
+                None,
+            )
+            defs.setdefault(tzid, current)
+    return defs
+
+
+def _iter_vcalendar_blocks(buf: Union[bytes, mmap.mmap]):
+    """
+    Yield each VCALENDAR block as text, walking the raw bytes once.
+    Blocks are decoded straight from a memoryview — no whole-file decode,
+    split list or per-block slice copies.
+    """
+    begin, end = b"BEGIN:VCALENDAR", b"END:VCALENDAR"
+    view = memoryview(buf)
+    try:
+        pos = buf.find(begin)
+        while pos >= 0:
+            nxt = buf.find(begin, pos + len(begin))
+            limit = nxt if nxt >= 0 else len(buf)
+            stop = buf.find(end, pos, limit)
+            if stop >= 0:
+                yield str(view[pos:stop + len(end)], "utf-8", "ignore")
+            else:
+                # Truncated block — close it so the scanner still sees its events
+                block = str(view[pos:limit], "utf-8", "ignore").rstrip()
+                yield block + "\nEND:VCALENDAR"
+            pos = nxt
+    finally:
+        # An mmap can't be closed while a view of it is still exported
+        view.release()
+
+
+def _iter_ics_file(ics_path: str):
+    """
+    Yield the export's VCALENDAR blocks from a read-only mmap, so only the
+    block being decoded is held in memory rather than the whole file.
+    """
+    with open(ics_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            yield from _iter_vcalendar_blocks(buf)
+
+
+def _overlaps_window(
+    start: datetime, end: datetime, window_start: datetime, window_end: datetime
+) -> bool:
+    if end <= start:
+        return window_start <= start < window_end
+    return start < window_end and end > window_start
+
+
+def _series_outside_window(
+    members: List[Tuple[_Props, List[str]]],
+    window_start: datetime,
+    window_end: datetime,
+    tz: ZoneInfo,
+) -> bool:
+    """
+    True when no occurrence of a recurring series can reach the window, so
+    it needn't be expanded at all: every RRULE starts after the window or
+    ends (UNTIL) before it, and every override sits outside it both where
+    it was moved to and where it came from. Anything the check can't bound
+    (RDATE, open-ended rules overlapping the window, DURATION, odd values)
+    keeps the series. A day of slack absorbs floating times and UNTIL
+    rounding.
+    """
+    lo = window_start - timedelta(days=1)
+    hi = window_end + timedelta(days=1)
+    masters = [props for props, _ in members if "RRULE" in props]
+    if not masters:
+        return False  # overrides alone: the master lives in another block
+
+    span = timedelta(0)
+    for props in masters:
+        if "RDATE" in props or "DURATION" in props:
+            return False
+        start = _decode_ics_datetime(*props["DTSTART"]) if "DTSTART" in props else None
+        end = _decode_ics_datetime(*props["DTEND"]) if "DTEND" in props else start
+        if start is None or end is None:
+            return False
+        start = normalize_to_datetime(start, tz)
+        span = max(span, normalize_to_datetime(end, tz) - start)
+        if start >= hi:
+            continue
+        rule = dict(
+            part.split("=", 1)
+            for part in props["RRULE"][1].upper().split(";")
+            if "=" in part
+        )
+        until = _decode_ics_datetime({}, rule.get("UNTIL", ""))
+        if until is None or normalize_to_datetime(until, tz) + span >= lo:
+            return False
+
+    for props, _ in members:
+        if "RRULE" in props:
+            continue
+        if "RDATE" in props or "DURATION" in props or "DTSTART" not in props:
+            return False
+        start = _decode_ics_datetime(*props["DTSTART"])
+        end = _decode_ics_datetime(*props["DTEND"]) if "DTEND" in props else start
+        rid = props.get("RECURRENCE-ID")
+        original = _decode_ics_datetime(*rid) if rid else None
+        if start is None or end is None or (rid and original is None):
+            return False
+        for begin, finish in ((start, end), (original, None)):
+            if begin is None:
+                continue
+            begin = normalize_to_datetime(begin, tz)
+            finish = normalize_to_datetime(finish, tz) if finish else begin + span
+            if begin < hi and finish >= lo:
+                return False
     return True
 
 
+def _load_ics_cache() -> Optional[Dict[str, Any]]:
+    """The last cached parse: signature, parsed range, events and their hashes."""
+    try:
+        with open(ICS_CACHE_PATH, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.debug(f"Ignoring unreadable ICS cache: {e}")
+        return None
+
+
+def _save_ics_cache(
+    signature: Tuple,
+    start: datetime,
+    end: datetime,
+    events: Dict[str, LocalEvent],
+    hashes: Dict[str, str],
+    series: Dict[Tuple, List[LocalEvent]],
+):
+    payload = pickle.dumps(
+        {
+            "signature": signature,
+            "start": start,
+            "end": end,
+            "events": events,
+            "hashes": hashes,
+            "series": series,
+        },
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=ROOT, prefix=".ics_cache_", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, ICS_CACHE_PATH)
+    except Exception as e:
+        log.warning(f"Failed to save ICS cache: {e}")
+        try:
+            os.unlink(tmp_path)
+        except Exception:
+            pass
+
+
 def load_local_events(
-    cfg: Dict[str, Any], tz: ZoneInfo
-) -> Dict[str, LocalEvent]:
+    cfg: Dict[str, Any], tz: ZoneInfo, st: Optional[os.stat_result] = None
+) -> Tuple[Dict[str, LocalEvent], Dict[str, str]]:
     """
-    Parse Outlook ICS export (may contain multiple VCALENDAR blocks).
-    Returns dict keyed by UID|normalized_start_time.
+    Load Outlook events in the sync window, keyed by UID|normalized_start_time,
+    along with their content hashes.
+
+    The export is only re-parsed (and re-hashed) when it changed (mtime/size)
+    or the window slid past the cached parse; otherwise the cached events
+    and hashes are re-filtered. `st` is the stat from a freshness check the
+    caller already ran; without it the check runs here.
     """
-    outbox_dir = os.path.join(ROOT, "outbox")
-    ics_path = os.path.join(outbox_dir, "outlook_full_export.ics")
+    ics_path = ICS_PATH
 
     # Staleness guard
-    max_age = float(cfg.get("max_ics_age_hours", 2.0))
-    check_ics_freshness(ics_path, max_age)
+    if st is None:
+        st = check_ics_freshness(ics_path, float(cfg.get("max_ics_age_hours", 2.0)))
 
     window_start, window_end = get_sync_window(cfg, tz)
     log.info(f"Sync window: {window_start} → {window_end}")
 
-    events: Dict[str, LocalEvent] = {}
-    stats = {"all_day": 0, "timed": 0, "recurring": 0, "errors": 0}
+    # LocalEvent's field names are part of the key so a cache pickled by
+    # an older layout of the dataclass is never unpickled into this one
+    signature = (
+        st.st_mtime_ns,
+        st.st_size,
+        str(tz),
+        VERSION,
+        HASH_SCHEME,
+        tuple(f.name for f in fields(LocalEvent)),
+    )
+    cache = _load_ics_cache()
+    if (
+        cache
+        and cache.get("signature") == signature
+        and cache["start"] <= window_start
+        and cache["end"] >= window_end
+    ):
+        parsed, parsed_hashes = cache["events"], cache["hashes"]
+        log.info(f"ICS unchanged since last parse — reusing {len(parsed)} cached events")
+    else:
+        # Whole days, so every run on the same day parses the same range
+        midnight = {"hour": 0, "minute": 0, "second": 0, "microsecond": 0}
+        parse_start = (window_start - ICS_CACHE_MARGIN).replace(**midnight)
+        parse_end = (window_end + ICS_CACHE_MARGIN).replace(**midnight) + timedelta(days=1)
+
+        # Most events survive a re-export untouched: an equal LocalEvent
+        # from the previous parse (same tz and layout) keeps its hash, and
+        # an unchanged recurring series keeps its expansion if the previous
+        # parse range still covers this one
+        previous: Dict[str, LocalEvent] = {}
+        previous_hashes: Dict[str, str] = {}
+        reuse_series = None
+        if cache and cache.get("signature", ())[2:] == signature[2:]:
+            previous, previous_hashes = cache["events"], cache["hashes"]
+            if cache["start"] <= parse_start and cache["end"] >= parse_end:
+                reuse_series = cache.get("series")
+        series: Dict[Tuple, List[LocalEvent]] = {}
+        parsed = parse_ics_file(
+            ics_path, tz, parse_start, parse_end, reuse_series, series
+        )
 
-    with open(ics_path, "rb") as f:
-        raw_data = f.read()
+        parsed_hashes = {}
+        for key, ev in parsed.items():
+            old = previous.get(key)
+            if old is not None and old == ev and key in previous_hashes:
+                parsed_hashes[key] = previous_hashes[key]
+            else:
+                parsed_hashes[key] = compute_event_hash(ev, tz)
+        _save_ics_cache(
+            signature, parse_start, parse_end, parsed, parsed_hashes, series
+        )
+
+    # Unpickled keys aren't interned; re-intern them like fresh parses
+    events = {
+        sys.intern(key): ev
+        for key, ev in parsed.items()
+        if _overlaps_window(
+            normalize_to_datetime(ev.start, tz),
+            normalize_to_datetime(ev.end, tz),
+            window_start,
+            window_end,
+        )
+    }
+    hashes = {key: parsed_hashes[key] for key in events}
+    log.info(f"{len(events)} events in sync window")
+    return events, hashes
 
-    content = raw_data.decode("utf-8", errors="ignore")
 
-    # Split into individual VCALENDAR blocks
-    blocks = content.split("BEGIN:VCALENDAR")
+def _event_from_component(comp, tz: ZoneInfo) -> Optional[LocalEvent]:
+    """LocalEvent for an icalendar VEVENT (or occurrence); None without UID/DTSTART."""
+    uid = str(comp.get("UID") or "").strip()
+    dtstart_prop = comp.get("DTSTART")
+    if not uid or not dtstart_prop:
+        return None
+    dtend_prop = comp.get("DTEND")
+    return make_local_event(
+        uid,
+        str(comp.get("SUMMARY") or "").strip(),
+        str(comp.get("LOCATION") or "").strip(),
+        str(comp.get("DESCRIPTION") or "").strip(),
+        dtstart_prop.dt,
+        dtend_prop.dt if dtend_prop is not None else None,
+        is_all_day_event(comp),
+        tz,
+    )
+
+
+def parse_ics_file(
+    ics_path: str,
+    tz: ZoneInfo,
+    window_start: datetime,
+    window_end: datetime,
+    reuse_series: Optional[Dict[Tuple, List[LocalEvent]]] = None,
+    series_out: Optional[Dict[Tuple, List[LocalEvent]]] = None,
+) -> Dict[str, LocalEvent]:
+    """
+    Parse Outlook ICS export (may contain multiple VCALENDAR blocks).
+    Returns dict keyed by UID|normalized_start_time.
+
+    One-off events are decoded straight from the text; only recurring
+    series (and anything the fast path can't resolve) go through
+    icalendar + recurring_ical_events. A series whose raw text matches an
+    entry in reuse_series (expanded over a range covering this window)
+    reuses those occurrences; series_out receives this parse's expansions.
+    """
+    events: Dict[str, LocalEvent] = {}
+    stats = {"all_day": 0, "timed": 0, "recurring": 0, "errors": 0}
+    # Recurring UID -> series signature awaiting expansion (None: ambiguous)
+    expanding: Dict[str, Optional[Tuple]] = {}
+    expanded_by_uid: Dict[str, List[LocalEvent]] = {}
+    expansion_failures: List[str] = []
+    reused = 0
+    skipped = 0
+
     vcal_count = 0
+    fallback_blocks: List[Tuple[List[str], List[str], List[str]]] = []
+    # VEVENTs already queued for icalendar; multi-block exports can repeat
+    # a series and every copy would otherwise be expanded again
+    deferred = set()
+
+    def defer(fallback: List[str], raw: List[str]):
+        sig = tuple(raw)
+        if sig not in deferred:
+            deferred.add(sig)
+            fallback.extend(raw)
+
+    def text_prop(props: _Props, name: str) -> str:
+        prop = props.get(name)
+        return _unescape_text(prop[1]).strip() if prop else ""
+
+    for ics_block in _iter_ics_file(ics_path):
+        header, timezones, vevents = _scan_vcalendar(ics_block)
+        vcal_count += 1
+
+        # Group by UID in one pass; UIDs are unescaped once per VEVENT
+        series: Dict[str, List[Tuple[_Props, List[str]]]] = {}
+        recurring_uids = set()
+        for props, raw in vevents:
+            uid = text_prop(props, "UID")
+            if not uid:
+                continue
+            series.setdefault(uid, []).append((props, raw))
+            if any(p in props for p in _RECURRENCE_PROPS):
+                recurring_uids.add(uid)
+        fallback: List[str] = []
+
+        for uid, members in series.items():
+            if uid in recurring_uids:
+                if _series_outside_window(members, window_start, window_end, tz):
+                    skipped += 1
+                    continue
+                sig = (
+                    tuple(timezones),
+                    tuple(line for _, raw in members for line in raw),
+                )
+                cached = reuse_series.get(sig) if reuse_series else None
+                if cached is not None:
+                    for ev in cached:
+                        stats["all_day" if ev.all_day else "timed"] += 1
+                        events[ev.key] = ev
+                    if series_out is not None:
+                        series_out[sig] = cached
+                    reused += 1
+                    continue
+                expanding[uid] = sig if expanding.get(uid, sig) == sig else None
+                # Master and overrides expand together in icalendar
+                for _, raw in members:
+                    defer(fallback, raw)
+                continue
 
-    for block in blocks:
-        if not block.strip():
-            continue
+            for props, raw in members:
+                try:
+                    # icalendar resolves DURATION; the fast path only knows DTEND
+                    if "DTSTART" not in props or "DURATION" in props:
+                        defer(fallback, raw)
+                        continue
+
+                    dtstart = _decode_ics_datetime(*props["DTSTART"])
+                    dtend = (
+                        _decode_ics_datetime(*props["DTEND"])
+                        if "DTEND" in props
+                        else None
+                    )
+                    if dtstart is None or ("DTEND" in props and dtend is None):
+                        defer(fallback, raw)
+                        continue
 
-        ics_block = "BEGIN:VCALENDAR" + block
-        if not ics_block.rstrip().endswith("END:VCALENDAR"):
-            ics_block = ics_block.rstrip() + "\nEND:VCALENDAR"
+                    ms_allday = props.get("X-MICROSOFT-CDO-ALLDAYEVENT")
+                    all_day = is_all_day(
+                        ms_allday[1] if ms_allday else None, dtstart, dtend
+                    )
+                    ev = make_local_event(
+                        uid,
+                        text_prop(props, "SUMMARY"),
+                        text_prop(props, "LOCATION"),
+                        text_prop(props, "DESCRIPTION"),
+                        dtstart,
+                        dtend,
+                        all_day,
+                        tz,
+                    )
+                    if not _overlaps_window(
+                        normalize_to_datetime(ev.start, tz),
+                        normalize_to_datetime(ev.end, tz),
+                        window_start,
+                        window_end,
+                    ):
+                        continue
+
+                    stats["all_day" if all_day else "timed"] += 1
+                    events[ev.key] = ev
+
+                except Exception as e:
+                    stats["errors"] += 1
+                    log.debug(f"Error parsing event: {e}")
+                    continue
+
+        if fallback:
+            fallback_blocks.append((header, timezones, fallback))
 
+    def expand(sub_ics: str, label: str, strict: bool = False) -> bool:
+        """
+        Expand one calendar's recurrences into events. False if it can't be
+        parsed, or (strict) if expansion fails — the caller then retries
+        block by block. Otherwise a failed expansion keeps the raw VEVENTs.
+        """
         try:
-            cal = Calendar.from_ical(ics_block.encode("utf-8"))
-            vcal_count += 1
+            cal = Calendar.from_ical(sub_ics.encode("utf-8"))
         except Exception as e:
-            log.debug(f"Skipping invalid VCALENDAR block: {e}")
-            continue
+            log.debug(f"Skipping invalid {label}: {e}")
+            if not strict:
+                expansion_failures.append(label)
+            return False
 
         try:
             expanded = recurring_of(cal).between(window_start, window_end)
         except Exception as e:
-            log.warning(f"Failed to expand recurrences in block: {e}")
+            if strict:
+                log.warning(
+                    f"Failed to expand recurrences in {label}: {e} — "
+                    f"expanding its blocks separately"
+                )
+                return False
+            log.warning(f"Failed to expand recurrences in {label}: {e}")
+            expansion_failures.append(label)
             expanded = list(cal.walk("VEVENT"))
 
         for comp in expanded:
@@ -481,89 +1306,69 @@ def load_local_events(
                 continue
 
             try:
-                uid = str(comp.get("UID") or "").strip()
-                if not uid:
+                ev = _event_from_component(comp, tz)
+                if ev is None:
                     continue
 
-                dtstart_prop = comp.get("DTSTART")
-                dtend_prop = comp.get("DTEND")
-                if not dtstart_prop:
-                    continue
-
-                dtstart = dtstart_prop.dt
-                dtend = dtend_prop.dt if dtend_prop is not None else None
-
                 if comp.get("RRULE") or comp.get("RECURRENCE-ID"):
                     stats["recurring"] += 1
+                stats["all_day" if ev.all_day else "timed"] += 1
 
-                all_day = is_all_day_event(comp)
-
-                if all_day:
-                    stats["all_day"] += 1
-                    # For all-day events, extract date without timezone conversion
-                    # to avoid midnight-UTC shifting to previous day in local tz
-                    if isinstance(dtstart, datetime):
-                        start_date = dtstart.date()
-                    else:
-                        start_date = dtstart
-                    if dtend:
-                        if isinstance(dtend, datetime):
-                            end_date = dtend.date()
-                        else:
-                            end_date = dtend
-                    else:
-                        end_date = start_date + timedelta(days=1)
-                    if end_date <= start_date:
-                        end_date = start_date + timedelta(days=1)
-
-                    start_key = start_date.isoformat()
-                    key = f"{uid}|{start_key}"
-
-                    events[key] = LocalEvent(
-                        uid=uid,
-                        key=key,
-                        summary=str(comp.get("SUMMARY") or "").strip(),
-                        location=str(comp.get("LOCATION") or "").strip(),
-                        description=str(comp.get("DESCRIPTION") or "").strip(),
-                        start=start_date,
-                        end=end_date,
-                        all_day=True,
-                    )
-                else:
-                    stats["timed"] += 1
-                    start_dt = normalize_to_datetime(dtstart, tz)
-                    end_dt = (
-                        normalize_to_datetime(dtend, tz)
-                        if dtend is not None
-                        else start_dt + timedelta(hours=1)
-                    )
-
-                    start_iso = start_dt.isoformat(timespec="seconds")
-                    if "T" in start_iso:
-                        date_part, time_part = start_iso.split("T", 1)
-                        time_part = time_part.split("+")[0].split("-")[0]
-                        start_key = f"{date_part}T{time_part[:8]}"
-                    else:
-                        start_key = start_iso
-                    key = f"{uid}|{start_key}"
-
-                    events[key] = LocalEvent(
-                        uid=uid,
-                        key=key,
-                        summary=str(comp.get("SUMMARY") or "").strip(),
-                        location=str(comp.get("LOCATION") or "").strip(),
-                        description=str(comp.get("DESCRIPTION") or "").strip(),
-                        start=start_dt,
-                        end=end_dt,
-                        all_day=False,
-                    )
+                events[ev.key] = ev
+                if ev.uid in expanding:
+                    expanded_by_uid.setdefault(ev.uid, []).append(ev)
 
             except Exception as e:
                 stats["errors"] += 1
                 log.debug(f"Error parsing event: {e}")
                 continue
+        return True
+
+    def block_calendar(header: List[str], timezones: List[str], lines: List[str]) -> str:
+        return "\n".join(["BEGIN:VCALENDAR", *header, *timezones, *lines, "END:VCALENDAR"])
+
+    if fallback_blocks:
+        # Blocks that agree on every shared TZID expand as one calendar:
+        # each VTIMEZONE is resolved once and the expander runs once. Outlook
+        # reuses names like "Customized Time Zone" with different rules, so
+        # a block that redefines a TZID is expanded on its own.
+        merged_tzs: Dict[Optional[str], List[str]] = {}
+        mergeable: List[Tuple[List[str], List[str], List[str]]] = []
+        separate: List[Tuple[List[str], List[str], List[str]]] = []
+        for block in fallback_blocks:
+            defs = _timezone_defs(block[1])
+            if any(merged_tzs.get(tzid, lines) != lines for tzid, lines in defs.items()):
+                separate.append(block)
+                continue
+            for tzid, lines in defs.items():
+                merged_tzs.setdefault(tzid, lines)
+            mergeable.append(block)
+
+        if len(mergeable) > 1:
+            merged = block_calendar(
+                mergeable[0][0],
+                [line for lines in merged_tzs.values() for line in lines],
+                [line for _, _, lines in mergeable for line in lines],
+            )
+            # One bad RRULE must not cost every series its expansion
+            if not expand(merged, "merged fallback calendar", strict=True):
+                separate.extend(mergeable)
+        else:
+            separate.extend(mergeable)
+
+        for header, timezones, fallback in separate:
+            expand(block_calendar(header, timezones, fallback), "VCALENDAR block")
+
+        if series_out is not None and not expansion_failures:
+            for uid, sig in expanding.items():
+                if sig is not None:
+                    series_out[sig] = expanded_by_uid.get(uid, [])
 
     log.info(f"Parsed {vcal_count} VCALENDAR blocks")
+    if skipped:
+        log.info(f"Skipped {skipped} recurring series entirely outside the window")
+    if reused:
+        log.info(f"Reused expansions of {reused} unchanged recurring series")
     log.info(
         f"Loaded {len(events)} events: {stats['all_day']} all-day, "
         f"{stats['timed']} timed, {stats['recurring']} recurring, "
@@ -590,28 +1395,14 @@ def build_event_body(ev: LocalEvent, tz_name: str) -> Dict[str, Any]:
         },
     }
 
+    # LocalEvent times are already normalized by make_local_event
     if ev.all_day:
-        start_date = (
-            ev.start if isinstance(ev.start, date) else ev.start.date()
-        )
-        end_date = ev.end if isinstance(ev.end, date) else ev.end.date()
-        body["start"] = {"date": start_date.isoformat()}
-        body["end"] = {"date": end_date.isoformat()}
+        body["start"] = {"date": ev.start.isoformat()}
+        body["end"] = {"date": ev.end.isoformat()}
         body["transparency"] = "transparent"
     else:
-        tz = ZoneInfo(tz_name)
-        start_dt = (
-            ev.start
-            if isinstance(ev.start, datetime)
-            else normalize_to_datetime(ev.start, tz)
-        )
-        end_dt = (
-            ev.end
-            if isinstance(ev.end, datetime)
-            else normalize_to_datetime(ev.end, tz)
-        )
-        body["start"] = {"dateTime": to_iso(start_dt), "timeZone": tz_name}
-        body["end"] = {"dateTime": to_iso(end_dt), "timeZone": tz_name}
+        body["start"] = {"dateTime": to_iso(ev.start), "timeZone": tz_name}
+        body["end"] = {"dateTime": to_iso(ev.end), "timeZone": tz_name}
 
     return body
 
@@ -623,6 +1414,13 @@ def get_time_window_iso(cfg: Dict[str, Any]) -> Tuple[str, str]:
     return time_min.isoformat(), time_max.isoformat()
 
 
+@lru_cache(maxsize=16384)
+def _parse_google_datetime(value: str) -> datetime:
+    """Parse an API dateTime; cached since each start is parsed for both the
+    window filter and the event key."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def _normalize_start_for_key(start: Dict[str, Any], tz: Optional[ZoneInfo] = None) -> Optional[str]:
     """
     Normalize Google event start time to match local key format.
@@ -638,44 +1436,158 @@ def _normalize_start_for_key(start: Dict[str, Any], tz: Optional[ZoneInfo] = Non
         return None
     # Parse with timezone offset and convert to config tz
     try:
-        parsed = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        parsed = _parse_google_datetime(dt_str)
         if tz and parsed.tzinfo is not None:
             parsed = parsed.astimezone(tz)
-        return parsed.strftime("%Y-%m-%dT%H:%M:%S")
+        return parsed.replace(tzinfo=None).isoformat(timespec="seconds")
     except (ValueError, AttributeError):
         # Fallback: strip timezone manually (legacy behavior)
         if "T" not in dt_str:
             return dt_str
-        date_part, time_part = dt_str.split("T", 1)
-        time_part = time_part.split("+")[0].split("-")[0]
-        time_part = time_part[:8]
+        date_part, _, rest = dt_str.partition("T")
+        time_part = rest[:8].partition("+")[0].partition("-")[0]
         return f"{date_part}T{time_part}"
 
 
-def safe_api_call(func, label: str, delay: float):
+def _error_reasons(e: HttpError) -> List[str]:
+    """Extract Google error reasons (e.g. 'rateLimitExceeded') from an HttpError."""
+    details = getattr(e, "error_details", None)
+    details = list(details) if isinstance(details, list) else []
+    try:
+        payload = json.loads(e.content.decode("utf-8"))
+        details.extend(payload.get("error", {}).get("errors", []))
+    except Exception:
+        pass
+    return [d.get("reason", "") for d in details if isinstance(d, dict)]
+
+
+def is_retryable(e: HttpError) -> bool:
+    """429, 5xx, and 403s whose reason is a rate limit (Calendar uses both)."""
+    status = e.resp.status if hasattr(e, "resp") else 0
+    if status == 429 or status >= 500:
+        return True
+    if status == 403:
+        return any(r in RATE_LIMIT_REASONS for r in _error_reasons(e))
+    return False
+
+
+class TokenBucket:
     """
-    Execute API call with exponential backoff on rate limits and server errors.
-    Retries on 429 (rate limit) and 5xx (server error).
+    Thread-safe request pacer shared by every worker. Holds up to `burst`
+    tokens refilled at `rate` per second; take(cost) only waits out whatever
+    part of the interval the request itself didn't already spend. A batch
+    costs one token per sub-request, since Google counts each against the
+    quota. Rate is halved on a rate-limit response and recovered
+    additively on success.
     """
-    backoff = INITIAL_BACKOFF_SECONDS
 
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 16
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, cost: float = 1.0):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= cost
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def backoff(self):
+        with self.lock:
+            self.rate = max(self.rate / 2, self.min_rate)
+
+    def recover(self):
+        with self.lock:
+            self.rate = min(self.rate + self.max_rate / 16, self.max_rate)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Google while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe breaker over whole API calls (not single attempts): once
+    `threshold` calls in a row have exhausted their retries, calls are
+    refused for `cooldown` seconds instead of each backing off in turn.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self.lock = threading.Lock()
+
+    def check(self, label: str):
+        with self.lock:
+            remaining = self.open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"{label}: skipped, Google API circuit open for {remaining:.0f}s"
+            )
+
+    def success(self):
+        with self.lock:
+            self.failures = 0
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.open_until = time.monotonic() + self.cooldown
+                self.failures = 0
+                log.error(
+                    f"Google API failing persistently — pausing calls for "
+                    f"{self.cooldown:.0f}s"
+                )
+
+
+_breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN_SECONDS)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform over [0, min(cap, base * 2^(attempt-1))]."""
+    ceiling = min(MAX_BACKOFF_SECONDS, INITIAL_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling)
+
+
+def safe_api_call(
+    func, label: str, limiter: Optional[TokenBucket], http=None, cost: int = 1
+):
+    """
+    Execute API call with full-jitter backoff on rate limits and server errors.
+    Retries on 429, 403 rateLimitExceeded, 5xx and dropped connections,
+    honoring Retry-After. Calls that exhaust their retries feed the
+    circuit breaker; while it is open, calls fail with CircuitOpenError.
+    `cost` is the number of API requests the call makes (a batch's size).
+    """
+    _breaker.check(label)
+    deadline = time.monotonic() + RETRY_DEADLINE_SECONDS
     for attempt in range(1, MAX_RETRIES + 1):
+        if limiter:
+            limiter.take(cost)
         try:
-            result = func.execute()
-            if delay > 0:
-                time.sleep(delay)
+            result = func.execute(http=http)
+            if limiter:
+                limiter.recover()
+            _breaker.success()
             return result
 
         except HttpError as e:
             status = e.resp.status if hasattr(e, "resp") else 0
 
-            if status == 429 or status >= 500:
-                if attempt == MAX_RETRIES:
-                    log.error(
-                        f"{label}: failed after {MAX_RETRIES} attempts "
-                        f"(HTTP {status})"
-                    )
-                    raise
+            if is_retryable(e):
+                if limiter:
+                    limiter.backoff()
 
                 # Check for Retry-After header
                 retry_after = None
@@ -685,136 +1597,476 @@ def safe_api_call(func, label: str, delay: float):
                     except (ValueError, TypeError):
                         pass
 
-                wait = retry_after if retry_after else backoff
+                # Full jitter keeps concurrent runs from retrying in lockstep
+                wait = retry_after if retry_after else _backoff_delay(attempt)
                 wait = min(wait, MAX_BACKOFF_SECONDS)
 
+                if attempt == MAX_RETRIES or time.monotonic() + wait > deadline:
+                    log.error(
+                        f"{label}: failed after {attempt} attempts "
+                        f"(HTTP {status})"
+                    )
+                    _breaker.failure()
+                    raise
+
                 log.warning(
                     f"{label}: HTTP {status}, retrying in {wait:.1f}s "
                     f"(attempt {attempt}/{MAX_RETRIES})"
                 )
                 time.sleep(wait)
-                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
             else:
-                # Non-retryable error (4xx other than 429)
+                # Non-retryable error (4xx other than rate limits)
                 log.error(f"{label}: HTTP {status}: {e}")
                 raise
 
+        except TRANSIENT_NETWORK_ERRORS as e:
+            wait = _backoff_delay(attempt)
+            if attempt == MAX_RETRIES or time.monotonic() + wait > deadline:
+                log.error(f"{label}: failed after {attempt} attempts ({e})")
+                _breaker.failure()
+                raise
+            log.warning(
+                f"{label}: {type(e).__name__}, retrying in {wait:.1f}s "
+                f"(attempt {attempt}/{MAX_RETRIES})"
+            )
+            time.sleep(wait)
+
     # Should not reach here, but just in case
     raise RuntimeError(f"{label}: exhausted retries")
 
 
-def fetch_google_events(
-    service, calendar_id: str, cfg: Dict[str, Any], tz: Optional[ZoneInfo] = None
-) -> Dict[str, Dict[str, Any]]:
-    """Fetch all Google events in sync window, keyed by UID|start."""
-    time_min, time_max = get_time_window_iso(cfg)
+def execute_batched(
+    service,
+    requests: List[Tuple[str, Any]],
+    label: str,
+    limiter: Optional[TokenBucket],
+    creds: Optional[Credentials] = None,
+    workers: int = 1,
+) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Execute (request_id, request) pairs as Google batch requests of up to
+    BATCH_SIZE sub-requests — one HTTP round trip per batch. With creds and
+    workers > 1, up to `workers` batches are in flight at once, each thread
+    on its own connection. Sub-requests that fail with a retryable error are
+    re-batched with full-jitter backoff. Returns {request_id: (response, exception)}.
+    """
+    parallel = creds is not None and workers > 1
+    results: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = {}
+    by_id = dict(requests)
+    pending = list(by_id)
+    # Paced passes can be long; the deadline bounds only the requeueing
+    deadline: Optional[float] = None
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        retry: List[str] = []
+
+        def on_response(request_id, response, exception):
+            # Recorded even when re-queued, so giving up leaves the last error
+            results[request_id] = (response, exception)
+            if (
+                isinstance(exception, HttpError)
+                and is_retryable(exception)
+                and attempt < MAX_RETRIES
+            ):
+                retry.append(request_id)
+
+        def run(chunk: List[str]):
+            batch = service.new_batch_http_request(callback=on_response)
+            for request_id in chunk:
+                batch.add(by_id[request_id], request_id=request_id)
+            http = _thread_http(creds) if parallel else None
+            try:
+                safe_api_call(
+                    batch, f"{label} batch", limiter, http=http, cost=len(chunk)
+                )
+            except Exception as e:
+                # The batch itself failed — nothing in it was applied, or
+                # (inserts) a replay lands on the same event id
+                for request_id in chunk:
+                    results.setdefault(request_id, (None, e))
+
+        chunks = [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+        if parallel and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                list(ex.map(run, chunks))
+        else:
+            for chunk in chunks:
+                run(chunk)
+
+        if not retry:
+            break
+        wait = _backoff_delay(attempt)
+        if deadline is None:
+            deadline = time.monotonic() + RETRY_DEADLINE_SECONDS
+        if time.monotonic() + wait > deadline:
+            log.error(f"{label}: giving up on {len(retry)} rate-limited request(s)")
+            break
+        log.warning(
+            f"{label}: {len(retry)} rate-limited in batch, retrying in "
+            f"{wait:.1f}s (attempt {attempt}/{MAX_RETRIES})"
+        )
+        time.sleep(wait)
+        pending = retry
+
+    return results
 
-    events_by_key: Dict[str, Dict[str, Any]] = {}
-    page_token = None
-    total = 0
 
+def _list_all_pages(service, params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Page through events.list; returns (items, nextSyncToken)."""
+    items: List[Dict[str, Any]] = []
+    page_token = None
     while True:
+        resp = safe_api_call(
+            service.events().list(pageToken=page_token, **params),
+            "list(events)",
+            None,
+        )
+        items.extend(resp.get("items", []))
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            return items, resp.get("nextSyncToken")
+
+
+def _parse_google_time(t: Dict[str, Any], tz: Optional[ZoneInfo]) -> Optional[datetime]:
+    if t.get("dateTime"):
+        return _parse_google_datetime(t["dateTime"])
+    if t.get("date"):
+        # All-day bounds are midnight in the config tz, as on the local side
+        return datetime.fromisoformat(t["date"]).replace(tzinfo=tz or timezone.utc)
+    return None
+
+
+def _in_window(
+    item: Dict[str, Any],
+    time_min: datetime,
+    time_max: datetime,
+    tz: Optional[ZoneInfo] = None,
+) -> bool:
+    """Same overlap rule load_local_events applies (_overlaps_window)."""
+    try:
+        start = _parse_google_time(item.get("start") or {}, tz)
+        end = _parse_google_time(item.get("end") or {}, tz) or start
+    except ValueError:
+        return True
+    if start is None:
+        return True
+    return _overlaps_window(start, end, time_min, time_max)
+
+
+def list_google_items(
+    service,
+    calendar_id: str,
+    cfg: Dict[str, Any],
+    state: Optional[SyncState],
+    tz: Optional[ZoneInfo] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Google events overlapping the sync window.
+
+    A full listing covers the window plus GOOGLE_CACHE_HORIZON_DAYS and is
+    cached in the state file with its nextSyncToken. Later runs fetch only
+    the delta via syncToken (which can't be combined with timeMin/timeMax)
+    until the window slides past the cached horizon, the token expires
+    (HTTP 410), or the calendar/window changes.
+    """
+    time_min_iso, time_max_iso = get_time_window_iso(cfg)
+    time_min = datetime.fromisoformat(time_min_iso)
+    time_max = datetime.fromisoformat(time_max_iso)
+    common = {
+        "calendarId": calendar_id,
+        "singleEvents": True,
+        "maxResults": 2500,
+        "fields": GOOGLE_LIST_FIELDS,
+    }
+
+    cache = state.get_google_cache(calendar_id) if state else None
+    if (
+        cache
+        and cache.get("sync_token")
+        and datetime.fromisoformat(cache["synced_from"]) <= time_min
+        and datetime.fromisoformat(cache["synced_through"]) >= time_max
+    ):
         try:
-            resp = (
-                service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    singleEvents=True,
-                    showDeleted=False,
-                    maxResults=2500,
-                    pageToken=page_token,
-                    orderBy="startTime",
-                )
-                .execute()
+            # Deltas must include deletions (status "cancelled") — the API
+            # rejects showDeleted=False together with a syncToken
+            delta, token = _list_all_pages(
+                service,
+                dict(common, showDeleted=True, syncToken=cache["sync_token"]),
             )
         except HttpError as e:
-            log.error(f"Failed to fetch Google events: {e}")
-            break
+            if getattr(e, "resp", None) is None or e.resp.status != 410:
+                raise SystemExit(f"Failed to fetch Google events: {e}")
+            log.info("Sync token expired, falling back to full listing")
+        else:
+            by_id = cache["items"]
+            for item in delta:
+                if item.get("status") == "cancelled":
+                    by_id.pop(item.get("id"), None)
+                elif item.get("id"):
+                    by_id[item["id"]] = item
+            # Deltas cover the whole calendar; keep only what the cached
+            # range can vouch for, and drop events the window has passed
+            synced_through = datetime.fromisoformat(cache["synced_through"])
+            cache["items"] = {
+                gid: item
+                for gid, item in by_id.items()
+                if _in_window(item, time_min, synced_through, tz)
+            }
+            cache["sync_token"] = token or cache["sync_token"]
+            state.set_google_cache(cache)
+            log.info(f"Incremental fetch: {len(delta)} changed events")
+            return [
+                i for i in cache["items"].values()
+                if _in_window(i, time_min, time_max, tz)
+            ]
+
+    synced_through = time_max + timedelta(days=GOOGLE_CACHE_HORIZON_DAYS)
+    # A day early: the API bounds all-day events by the calendar's own
+    # timezone, so let _in_window make the final cut at the edge
+    synced_from = (time_min - timedelta(days=1)).isoformat()
+    try:
+        items, token = _list_all_pages(
+            service,
+            dict(
+                common,
+                showDeleted=False,
+                timeMin=synced_from,
+                timeMax=synced_through.isoformat(),
+            ),
+        )
+    except HttpError as e:
+        # A partial view of Google would re-insert everything we
+        # failed to see, so never sync against an incomplete list.
+        raise SystemExit(f"Failed to fetch Google events: {e}")
+
+    if state is not None and token:
+        state.set_google_cache({
+            "calendar_id": calendar_id,
+            "sync_token": token,
+            "synced_from": synced_from,
+            "synced_through": synced_through.isoformat(),
+            "items": {i["id"]: i for i in items if i.get("id")},
+        })
+    elif state is not None:
+        state.clear_google_cache()
+    return [i for i in items if _in_window(i, time_min, time_max, tz)]
 
-        items = resp.get("items", [])
-        total += len(items)
 
-        for item in items:
-            ext = (item.get("extendedProperties") or {}).get("private") or {}
-            ical_uid = ext.get("icalUID") or item.get("iCalUID")
-            if not ical_uid:
-                continue
+def fetch_google_events(
+    service,
+    calendar_id: str,
+    cfg: Dict[str, Any],
+    tz: Optional[ZoneInfo] = None,
+    state: Optional[SyncState] = None,
+) -> Dict[str, GoogleEvent]:
+    """Fetch all Google events in sync window, keyed by UID|start."""
+    items = list_google_items(service, calendar_id, cfg, state, tz)
 
-            start_key = _normalize_start_for_key(item.get("start") or {}, tz)
-            if not start_key:
-                continue
+    events_by_key: Dict[str, GoogleEvent] = {}
+    for item in items:
+        gid = item.get("id")
+        ext = (item.get("extendedProperties") or {}).get("private") or {}
+        ical_uid = ext.get("icalUID") or item.get("iCalUID")
+        if not gid or not ical_uid:
+            continue
 
-            key = f"{ical_uid}|{start_key}"
-            events_by_key[key] = item
+        start_key = _normalize_start_for_key(item.get("start") or {}, tz)
+        if not start_key:
+            continue
 
-        page_token = resp.get("nextPageToken")
-        if not page_token:
-            break
+        # Only events we created (ORPHAN_MARKER) are candidates for deletion
+        key = sys.intern(f"{ical_uid}|{start_key}")
+        events_by_key[key] = GoogleEvent(
+            gid,
+            item.get("summary", "(no title)"),
+            ext.get("source") == ORPHAN_MARKER,
+        )
 
-    log.info(f"Fetched {total} events from Google Calendar")
+    log.info(f"Fetched {len(items)} events from Google Calendar")
     return events_by_key
 
 
-def is_our_event(item: Dict[str, Any]) -> bool:
-    ext = (item.get("extendedProperties") or {}).get("private") or {}
-    return ext.get("source") == ORPHAN_MARKER
-
-
 # ============================================================================
 # Sync Operations
 # ============================================================================
 
-def upsert_event(
+def _event_id(key: str) -> str:
+    """
+    Deterministic Google event id for a key (base32hex, as the API requires),
+    so a replayed insert hits 409 instead of creating a second copy.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return base64.b32hexencode(digest).decode("ascii").rstrip("=").lower()
+
+
+def _already_exists(e: Exception) -> bool:
+    """409 on insert: our event id is taken, i.e. the event was created before."""
+    status = getattr(getattr(e, "resp", None), "status", None)
+    return isinstance(e, HttpError) and status == 409
+
+
+def insert_events(
     service,
     calendar_id: str,
-    ev: LocalEvent,
-    body: Dict[str, Any],
-    existing: Optional[Dict[str, Any]],
+    inserts: List[Tuple[LocalEvent, Dict[str, Any], str]],
     state: SyncState,
-    content_hash: str,
-    api_delay: float,
-) -> Tuple[str, str]:
-    """Create or update event, return (action, google_id)."""
-    if existing:
-        gid = existing.get("id")
+    limiter: Optional[TokenBucket],
+    creds: Optional[Credentials] = None,
+    workers: int = 1,
+) -> Tuple[List[str], int]:
+    """
+    Batch-insert (event, body, hash) tuples; return (google_ids, failed).
 
-        stored_hash = state.get_hash(ev.key)
-        if stored_hash == content_hash:
-            return "skipped", gid
+    Each event is inserted under _event_id(key), so retries are safe. A 409
+    means the id already exists — an earlier attempt landed, or the event
+    was deleted and Google still holds its id — and is resolved by patching
+    that event back to the desired (confirmed) state.
+    """
+    if not inserts:
+        return [], 0
+
+    by_key = {ev.key: (ev, body, content_hash) for ev, body, content_hash in inserts}
+    requests = []
+    for ev, body, _ in inserts:
+        log.info(f"Creating: {ev.summary[:50]}")
+        requests.append((
+            ev.key,
+            service.events().insert(
+                calendarId=calendar_id,
+                body=dict(body, id=_event_id(ev.key)),
+                fields=WRITE_RESPONSE_FIELDS,
+            ),
+        ))
+
+    created: List[str] = []
+    failed = 0
+    conflicts = []
+    results = execute_batched(
+        service, requests, "insert", limiter, creds, workers
+    )
+    for key, (response, exception) in results.items():
+        ev, body, content_hash = by_key[key]
+        if exception is not None:
+            if _already_exists(exception):
+                conflicts.append((
+                    key,
+                    service.events().patch(
+                        calendarId=calendar_id,
+                        eventId=_event_id(key),
+                        body=dict(body, status="confirmed"),
+                        fields=WRITE_RESPONSE_FIELDS,
+                    ),
+                ))
+                continue
+            failed += 1
+            log.error(f"Failed to sync '{ev.summary[:40]}': {exception}")
+            continue
+        state.set_hash(key, content_hash, response["id"])
+        created.append(response["id"])
 
+    if conflicts:
+        log.info(f"{len(conflicts)} event(s) already exist under their id, restoring")
+        results = execute_batched(
+            service, conflicts, "insert (existing)", limiter, creds, workers
+        )
+        for key, (response, exception) in results.items():
+            ev, _, content_hash = by_key[key]
+            if exception is not None:
+                failed += 1
+                log.error(f"Failed to sync '{ev.summary[:40]}': {exception}")
+                continue
+            gid = response.get("id") or _event_id(key)
+            state.set_hash(key, content_hash, gid)
+            created.append(gid)
+    return created, failed
+
+
+def patch_events(
+    service,
+    calendar_id: str,
+    updates: List[Tuple[LocalEvent, str, Dict[str, Any], str]],
+    state: SyncState,
+    limiter: Optional[TokenBucket],
+    creds: Optional[Credentials] = None,
+    workers: int = 1,
+) -> Tuple[int, int]:
+    """Batch-patch (event, google_id, body, hash) tuples; return (updated, failed)."""
+    if not updates:
+        return 0, 0
+
+    by_key = {ev.key: (ev, gid, content_hash) for ev, gid, _, content_hash in updates}
+    requests = []
+    for ev, gid, body, _ in updates:
         log.info(f"Updating: {ev.summary[:50]}")
-        updated = safe_api_call(
+        requests.append((
+            ev.key,
             service.events().patch(
-                calendarId=calendar_id, eventId=gid, body=body
+                calendarId=calendar_id,
+                eventId=gid,
+                body=body,
+                fields=WRITE_RESPONSE_FIELDS,
             ),
-            f"patch({ev.summary[:30]})",
-            api_delay,
-        )
-        state.set_hash(ev.key, content_hash, gid)
-        return "updated", updated["id"]
-
-    log.info(f"Creating: {ev.summary[:50]}")
-    created = safe_api_call(
-        service.events().insert(calendarId=calendar_id, body=body),
-        f"insert({ev.summary[:30]})",
-        api_delay,
+        ))
+
+    updated = failed = 0
+    results = execute_batched(
+        service, requests, "patch", limiter, creds, workers
     )
-    gid = created["id"]
-    state.set_hash(ev.key, content_hash, gid)
-    return "created", gid
+    for key, (response, exception) in results.items():
+        ev, gid, content_hash = by_key[key]
+        if exception is not None:
+            failed += 1
+            log.error(f"Failed to sync '{ev.summary[:40]}': {exception}")
+            continue
+        state.set_hash(key, content_hash, response.get("id", gid))
+        updated += 1
+    return updated, failed
 
 
-def delete_event(
-    service, calendar_id: str, gid: str, summary: str, api_delay: float
-):
-    log.info(f"Deleting: {summary[:50]} ({gid})")
-    safe_api_call(
-        service.events().delete(calendarId=calendar_id, eventId=gid),
-        f"delete({summary[:30]})",
-        api_delay,
+def _already_deleted(e: Exception) -> bool:
+    """404/410 on delete: the event is gone, which is what we wanted."""
+    status = getattr(getattr(e, "resp", None), "status", None)
+    return isinstance(e, HttpError) and status in (404, 410)
+
+
+def delete_events(
+    service,
+    calendar_id: str,
+    deletes: List[Tuple[str, GoogleEvent]],
+    state: SyncState,
+    limiter: Optional[TokenBucket],
+    creds: Optional[Credentials] = None,
+    workers: int = 1,
+) -> Tuple[int, int]:
+    """Batch-delete (key, google_event) pairs; return (deleted, failed)."""
+    if not deletes:
+        return 0, 0
+
+    by_gid = {item.id: (key, item) for key, item in deletes}
+    requests = []
+    for key, item in deletes:
+        log.info(f"Deleting: {item.summary[:50]} ({item.id})")
+        requests.append((
+            item.id,
+            service.events().delete(calendarId=calendar_id, eventId=item.id),
+        ))
+
+    deleted = failed = 0
+    results = execute_batched(
+        service, requests, "delete", limiter, creds, workers
     )
+    for gid, (_, exception) in results.items():
+        key, item = by_gid[gid]
+        if exception is not None and not _already_deleted(exception):
+            failed += 1
+            log.error(f"Failed to delete {gid}: {exception}")
+            continue
+        if exception is not None:
+            log.info(f"Already deleted on Google: {item.summary[:50]} ({gid})")
+            state.drop_google_item(gid)
+        state.remove(key)
+        deleted += 1
+    return deleted, failed
 
 
 # ============================================================================
@@ -836,16 +2088,34 @@ def main():
     log.info("=" * 60)
 
     state = SyncState(STATE_PATH)
-    service = get_google_service()
+    creds = get_credentials()
+    service = get_google_service(creds)
+    workers = cfg["batch_workers"]
+    # api_delay_seconds is the minimum spacing per worker between API
+    # requests — sub-requests of a batch each count, as in Google's quota
+    limiter = (
+        TokenBucket(workers / api_delay, burst=BATCH_SIZE) if api_delay > 0 else None
+    )
 
-    # Parse local events (includes staleness check)
-    local_events = load_local_events(cfg, tz)
-    if not local_events:
-        log.error("No local events parsed; aborting to prevent destructive sync")
+    # Refuse a stale or empty export before paying for a Google listing
+    ics_stat = check_ics_freshness(ICS_PATH, float(cfg.get("max_ics_age_hours", 2.0)))
+    if ics_stat.st_size == 0:
+        log.error("ICS export is empty; aborting to prevent destructive sync")
         raise SystemExit(1)
 
-    # Fetch Google events
-    google_events = fetch_google_events(service, cal_id, cfg, tz)
+    # List Google events in the background while the ICS is parsed —
+    # one is network-bound, the other CPU-bound
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        google_future = ex.submit(
+            fetch_google_events, service, cal_id, cfg, tz, state=state
+        )
+
+        local_events, local_hashes = load_local_events(cfg, tz, ics_stat)
+        if not local_events:
+            log.error("No local events parsed; aborting to prevent destructive sync")
+            raise SystemExit(1)
+
+        google_events = google_future.result()
 
     stats = {
         "created": 0,
@@ -856,20 +2126,42 @@ def main():
     }
     processed_google_ids = set()
 
-    # Upsert local → Google
+    # Upsert local → Google: new and changed events are collected here
+    # and sent as batch requests below
+    inserts: List[Tuple[LocalEvent, Dict[str, Any], str]] = []
+    updates: List[Tuple[LocalEvent, str, Dict[str, Any], str]] = []
     total_local = len(local_events)
-    for i, (key, ev) in enumerate(local_events.items(), 1):
+    pending = local_events
+
+    # No-op run: both sides hold exactly the same keys and every stored
+    # hash and Google ID is current, so there is nothing to compare
+    if local_events.keys() == google_events.keys() and all(
+        state.get_hash(key) == local_hashes[key]
+        and state.get_google_id(key) == google_events[key].id
+        for key in local_events
+    ):
+        log.info(f"No changes: all {total_local} events already in sync")
+        stats["skipped"] = total_local
+        pending = {}
+
+    for i, (key, ev) in enumerate(pending.items(), 1):
         try:
-            body = build_event_body(ev, cfg["timezone"])
-            content_hash = compute_event_hash(ev, tz)
+            content_hash = local_hashes[key]
 
             existing = google_events.get(key)
-            action, gid = upsert_event(
-                service, cal_id, ev, body, existing, state,
-                content_hash, api_delay,
-            )
-            stats[action] += 1
-            processed_google_ids.add(gid)
+            if existing:
+                gid = existing.id
+                processed_google_ids.add(gid)
+                if hash_matches(state.get_hash(key), content_hash, ev, tz):
+                    # Re-store so legacy hashes migrate as they're seen
+                    state.set_hash(key, content_hash, gid)
+                    stats["skipped"] += 1
+                else:
+                    body = build_event_body(ev, cfg["timezone"])
+                    updates.append((ev, gid, body, content_hash))
+            else:
+                body = build_event_body(ev, cfg["timezone"])
+                inserts.append((ev, body, content_hash))
 
             # Progress logging every 100 events
             if i % 100 == 0:
@@ -879,24 +2171,44 @@ def main():
             stats["failed"] += 1
             log.error(f"Failed to sync '{ev.summary[:40]}': {e}")
 
-    # Delete orphaned events
-    local_keys = set(local_events.keys())
-    for key, item in google_events.items():
-        if key in local_keys:
-            continue
-        if not is_our_event(item):
-            continue
-        gid = item.get("id")
-        if not gid or gid in processed_google_ids:
-            continue
-        try:
-            summary = item.get("summary", "(no title)")
-            delete_event(service, cal_id, gid, summary, api_delay)
-            stats["deleted"] += 1
-            state.remove(key)
-        except Exception as e:
-            stats["failed"] += 1
-            log.error(f"Failed to delete {gid}: {e}")
+    try:
+        created_ids, failed = insert_events(
+            service, cal_id, inserts, state, limiter, creds, workers
+        )
+        stats["created"] += len(created_ids)
+        stats["failed"] += failed
+        processed_google_ids.update(created_ids)
+    except Exception as e:
+        stats["failed"] += len(inserts)
+        log.error(f"Failed to create {len(inserts)} new event(s): {e}")
+
+    try:
+        updated, failed = patch_events(
+            service, cal_id, updates, state, limiter, creds, workers
+        )
+        stats["updated"] += updated
+        stats["failed"] += failed
+    except Exception as e:
+        stats["failed"] += len(updates)
+        log.error(f"Failed to patch {len(updates)} changed event(s): {e}")
+
+    # Delete orphaned events — only keys Google has and Outlook doesn't
+    orphan_keys = google_events.keys() - local_events.keys()
+    deletes = [
+        (key, google_events[key])
+        for key in orphan_keys
+        if google_events[key].ours
+        and google_events[key].id not in processed_google_ids
+    ]
+    try:
+        deleted, failed = delete_events(
+            service, cal_id, deletes, state, limiter, creds, workers
+        )
+        stats["deleted"] += deleted
+        stats["failed"] += failed
+    except Exception as e:
+        stats["failed"] += len(deletes)
+        log.error(f"Failed to delete {len(deletes)} orphaned event(s): {e}")
 
     # Save state (atomic)
     state.save()
@@ -0,0 +1,100 @@
+"""The fast ICS scanner must build the same events as the icalendar path."""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from icalendar import Calendar
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import safe_sync  # noqa: E402
+
+TZ = safe_sync.get_timezone("America/New_York")
+WINDOW_START = datetime(2026, 10, 1, tzinfo=TZ)
+WINDOW_END = datetime(2026, 11, 1, tzinfo=TZ)
+
+CASES = {
+    "no_dtend": [
+        "UID:no-dtend",
+        "SUMMARY:Reminder",
+        "DTSTART;TZID=America/New_York:20261010T090000",
+    ],
+    "quoted_tzid": [
+        "UID:quoted",
+        "SUMMARY:Standup",
+        'DTSTART;TZID="America/New_York":20261010T093000',
+        'DTEND;TZID="America/New_York":20261010T094500',
+    ],
+    "utc": [
+        "UID:utc",
+        "SUMMARY:Call",
+        "DTSTART:20261010T140000Z",
+        "DTEND:20261010T150000Z",
+    ],
+    "escaped_text": [
+        "UID:escaped",
+        "SUMMARY:Lunch\\, then review\\; bring notes",
+        "LOCATION:Room 4\\, Building \\\\B",
+        "DESCRIPTION:Line one\\nLine two\\NLine three",
+        "DTSTART;TZID=America/New_York:20261011T120000",
+        "DTEND;TZID=America/New_York:20261011T130000",
+    ],
+    "folded": [
+        "UID:folded",
+        "SUMMARY:A summary long enough that Outlook folds it across",
+        "  two physical lines",
+        "DESCRIPTION:First part",
+        "\tsecond part after a tab",
+        "DTSTART;TZID=America/New_York:20261012T080000",
+        "DTEND;TZID=America/New_York:20261012T083000",
+    ],
+    "value_date": [
+        "UID:value-date",
+        "SUMMARY:Holiday",
+        "DTSTART;VALUE=DATE:20261012",
+        "DTEND;VALUE=DATE:20261013",
+    ],
+    "ms_allday": [
+        "UID:ms-allday",
+        "SUMMARY:Offsite",
+        "DTSTART;TZID=America/New_York:20261014T000000",
+        "DTEND;TZID=America/New_York:20261016T000000",
+        "X-MICROSOFT-CDO-ALLDAYEVENT:TRUE",
+    ],
+}
+
+
+def _ics(vevent_lines):
+    return "\r\n".join([
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "BEGIN:VEVENT",
+        *vevent_lines,
+        "END:VEVENT",
+        "END:VCALENDAR",
+        "",
+    ])
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_scanner_matches_icalendar(name, tmp_path, monkeypatch):
+    text = _ics(CASES[name])
+    path = tmp_path / "export.ics"
+    path.write_text(text)
+
+    # Any deferral to icalendar would hide a scanner difference; fail it instead
+    monkeypatch.setattr(safe_sync, "Calendar", None)
+    scanned = safe_sync.parse_ics_file(str(path), TZ, WINDOW_START, WINDOW_END)
+    monkeypatch.undo()
+
+    (comp,) = Calendar.from_ical(text.encode("utf-8")).walk("VEVENT")
+    expected = safe_sync._event_from_component(comp, TZ)
+
+    assert list(scanned.values()) == [expected]
+    (ev,) = scanned.values()
+    assert ev.key == expected.key
+    assert safe_sync.compute_event_hash(ev, TZ) == safe_sync.compute_event_hash(
+        expected, TZ
+    )
@@ -0,0 +1,72 @@
+"""Tests for the recurring-series window pre-filter in safe_sync."""
+
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import safe_sync  # noqa: E402
+
+TZ = safe_sync.get_timezone("America/New_York")
+WINDOW_START = datetime(2026, 10, 1, tzinfo=TZ)
+WINDOW_END = datetime(2026, 11, 1, tzinfo=TZ)
+
+
+def _series(*vevent_lines: str):
+    """Scan one VEVENT into the (props, raw) members the pre-filter takes."""
+    text = "\r\n".join([
+        "BEGIN:VCALENDAR",
+        "BEGIN:VEVENT",
+        *vevent_lines,
+        "END:VEVENT",
+        "END:VCALENDAR",
+    ])
+    _, _, vevents = safe_sync._scan_vcalendar(text)
+    return vevents
+
+
+def _outside(members) -> bool:
+    return safe_sync._series_outside_window(members, WINDOW_START, WINDOW_END, TZ)
+
+
+def test_ended_series_is_skipped():
+    members = _series(
+        "UID:ended",
+        "DTSTART;TZID=America/New_York:20200106T090000",
+        "DTEND;TZID=America/New_York:20200106T100000",
+        "RRULE:FREQ=WEEKLY;UNTIL=20200601T130000Z",
+    )
+    assert _outside(members)
+
+
+def test_series_starting_after_window_is_skipped():
+    members = _series(
+        "UID:future",
+        "DTSTART;TZID=America/New_York:20300106T090000",
+        "DTEND;TZID=America/New_York:20300106T100000",
+        "RRULE:FREQ=DAILY",
+    )
+    assert _outside(members)
+
+
+def test_duration_series_overlapping_window_is_kept():
+    # The last occurrence starts before the window but its ten days reach into it
+    members = _series(
+        "UID:long",
+        "DTSTART;TZID=America/New_York:20260901T090000",
+        "DURATION:P10D",
+        "RRULE:FREQ=WEEKLY;UNTIL=20260927T130000Z",
+    )
+    assert "DURATION" in members[0][0]
+    assert not _outside(members)
+
+
+def test_count_only_series_is_kept():
+    members = _series(
+        "UID:count",
+        "DTSTART;TZID=America/New_York:20200106T090000",
+        "DTEND;TZID=America/New_York:20200106T100000",
+        "RRULE:FREQ=WEEKLY;COUNT=3",
+    )
+    assert not _outside(members)